@@ -1,14 +1,18 @@
 import os
-import json
-import requests
+import orjson
+import httpx
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from flask import Flask, jsonify, request
-from bs4 import BeautifulSoup
+from flask import Flask, request
+from selectolax.lexbor import LexborHTMLParser
 import re
+import heapq
+from time import monotonic
 from urllib.parse import urljoin
 import logging
-from typing import Dict, List, Optional
-import hashlib
+import threading
+from typing import Dict, List, Optional, Set
+import xxhash
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -16,6 +20,46 @@ logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 
+def ojsonify(obj, status: int = 200):
+    """Build a JSON response serialized with orjson"""
+    return app.response_class(orjson.dumps(obj), status=status, mimetype='application/json')
+
+# Precompiled price patterns, checked in priority order
+_PRICE_DOLLAR = re.compile(r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)')
+_PRICE_CYCLES = re.compile(r'(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*cycles?', re.IGNORECASE)
+_PRICE_RANGE = re.compile(r'(\d+(?:,\d{3})*)\s*-\s*(\d+(?:,\d{3})*)')
+
+_ELEMENT_PRICE_PATTERNS = (_PRICE_DOLLAR, _PRICE_CYCLES, _PRICE_RANGE)
+
+# Dollar amounts and ranges fused into one pattern so a page is scanned once
+_PRICE_ANY = re.compile(
+    r'\$(?P<dollar>\d{1,3}(?:,\d{3})*(?:\.\d{2})?)'
+    r'|(?P<lo>\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*-\s*(?P<hi>\d{1,3}(?:,\d{3})*(?:\.\d{2})?)'
+)
+
+_TITLE_SELECTORS = ('h1', 'h2', 'h3', '.title', '[class*="title"]')
+
+# Bounty card selectors; the substring selectors are only tried when the
+# cheaper tag/data-attribute ones yield no bounties
+_FAST_BOUNTY_SELECTORS = ('div[data-testid*="bounty"]', '.bounty-card', '.service-card')
+_SLOW_BOUNTY_SELECTORS = ('[class*="bounty"]', '[class*="service"]')
+
+# Prices sit near the top of a card, so only this much of its text is scanned
+_TEXT_SCAN_LIMIT = 4096
+
+# Number of highest prices kept when falling back to whole-page text
+_TEXT_TOP_K = 10
+
+# Probe threads shared by all requests; overlapping scrapes queue behind
+# each other, which the scrape cache keeps rare
+_PROBE_WORKERS = 8
+
+# Seconds a successful scrape is reused to absorb bursts of endpoint hits
+_SCRAPE_CACHE_TTL = 60
+
+# Placeholders in the prebuilt Slack message template
+_SLACK_SENTINEL = re.compile(rb'__(?:PRICE|TITLE|POSTED|LINK|NOW)__')
+
 class ReplitBountyScraper:
     """Scraper for Replit bounties/services"""
     
@@ -27,13 +71,34 @@ class ReplitBountyScraper:
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         }
         
+        # Pooled HTTP/2 client so the connection to replit.com is reused
+        # across URL probes and across scrapes
+        self.client = httpx.Client(
+            headers=self.headers,
+            timeout=30.0,
+            follow_redirects=True,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=2,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            ),
+        )
+        # Shared by all request threads
+        self.probe_executor = ThreadPoolExecutor(max_workers=_PROBE_WORKERS)
+        # (monotonic timestamp, bounties) of the last successful scrape
+        self._cache = (0.0, None)
+        
     def scrape_bounties(self) -> List[Dict]:
         """Scrape bounties from Replit"""
         try:
+            ts, data = self._cache
+            if data is not None and monotonic() - ts < _SCRAPE_CACHE_TTL:
+                logger.info("Returning cached Replit bounties")
+                return data
+            
             logger.info("Starting to scrape Replit bounties...")
             
             # Try different URL patterns since Replit changed their structure
@@ -43,14 +108,21 @@ class ReplitBountyScraper:
                 "https://replit.com/site/bounties"
             ]
             
-            for url in urls_to_try:
+            # Probe all URLs concurrently but parse the successful response
+            # of the highest-priority URL, so the filtered listing wins
+            futures = [self.probe_executor.submit(self.client.get, url) for url in urls_to_try]
+            for url, future in zip(urls_to_try, futures):
                 try:
-                    response = requests.get(url, headers=self.headers, timeout=30)
-                    if response.status_code == 200:
-                        return self._parse_bounties(response.text, url)
+                    response = future.result()
                 except Exception as e:
                     logger.warning(f"Failed to fetch {url}: {str(e)}")
                     continue
+                if response.status_code == 200:
+                    bounties = self._parse_bounties(response.text, url)
+                    if bounties is None:
+                        return []
+                    self._cache = (monotonic(), bounties)
+                    return bounties
             
             # If all URLs fail, return sample data for testing
             logger.warning("All URLs failed, returning sample data")
@@ -60,34 +132,31 @@ class ReplitBountyScraper:
             logger.error(f"Error scraping bounties: {str(e)}")
             return []
     
-    def _parse_bounties(self, html_content: str, url: str) -> List[Dict]:
-        """Parse bounties from HTML content"""
+    def _parse_bounties(self, html_content: str, url: str) -> Optional[List[Dict]]:
+        """Parse bounties from HTML content, returning None if parsing failed"""
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            bounties = []
+            tree = LexborHTMLParser(html_content)
+            bounties_by_id = {}
+            # All bounties from one scrape share the same timestamp
+            now_iso = datetime.now().isoformat()
             
-            # Look for bounty cards or service listings
-            bounty_selectors = [
-                'div[data-testid*="bounty"]',
-                '.bounty-card',
-                '.service-card',
-                '[class*="bounty"]',
-                '[class*="service"]'
-            ]
+            # Look for bounty cards or service listings; results of the
+            # specific selectors are merged
+            for selector in _FAST_BOUNTY_SELECTORS:
+                self._collect_bounties(tree, selector, url, now_iso, bounties_by_id)
             
-            for selector in bounty_selectors:
-                bounty_elements = soup.select(selector)
-                if bounty_elements:
-                    logger.info(f"Found {len(bounty_elements)} bounty elements with selector: {selector}")
-                    for element in bounty_elements:
-                        bounty = self._extract_bounty_data(element, url)
-                        if bounty:
-                            bounties.append(bounty)
-                    break
+            # Otherwise the first substring selector that yields bounties wins
+            if not bounties_by_id:
+                for selector in _SLOW_BOUNTY_SELECTORS:
+                    self._collect_bounties(tree, selector, url, now_iso, bounties_by_id)
+                    if bounties_by_id:
+                        break
             
             # If no specific bounty elements found, look for general patterns
-            if not bounties:
-                bounties = self._extract_from_text(html_content, url)
+            if not bounties_by_id:
+                for bounty in self._extract_from_text(html_content, url, now_iso):
+                    self._add_bounty(bounties_by_id, bounty)
+            bounties = list(bounties_by_id.values())
             
             # Filter bounties from last 24 hours
             recent_bounties = self._filter_recent_bounties(bounties)
@@ -97,58 +166,54 @@ class ReplitBountyScraper:
             
         except Exception as e:
             logger.error(f"Error parsing bounties: {str(e)}")
-            return []
+            return None
+    
+    def _collect_bounties(self, tree, selector: str, url: str, posted_time: str, bounties_by_id: Dict[str, Dict]):
+        """Extract bounties from every element matching selector"""
+        bounty_elements = tree.css(selector)
+        if bounty_elements:
+            logger.info(f"Found {len(bounty_elements)} bounty elements with selector: {selector}")
+            for element in bounty_elements:
+                bounty = self._extract_bounty_data(element, url, posted_time)
+                if bounty:
+                    self._add_bounty(bounties_by_id, bounty)
+    
+    def _add_bounty(self, bounties_by_id: Dict[str, Dict], bounty: Dict):
+        """Add a bounty keyed on its ID, keeping the higher price on collision"""
+        existing = bounties_by_id.get(bounty['id'])
+        if existing is None or bounty['price'] > existing['price']:
+            bounties_by_id[bounty['id']] = bounty
     
-    def _extract_bounty_data(self, element, base_url: str) -> Optional[Dict]:
+    def _extract_bounty_data(self, element, base_url: str, posted_time: str) -> Optional[Dict]:
         """Extract bounty data from a single element"""
         try:
             # Extract title
-            title_selectors = ['h1', 'h2', 'h3', '.title', '[class*="title"]']
             title = "Unknown Title"
-            for selector in title_selectors:
-                title_elem = element.select_one(selector)
+            for selector in _TITLE_SELECTORS:
+                title_elem = element.css_first(selector)
                 if title_elem:
-                    title = title_elem.get_text(strip=True)
+                    title = title_elem.text(strip=True)
                     break
             
             # Extract price/value
-            price_patterns = [
-                r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)',
-                r'(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*cycles?',
-                r'(\d+(?:,\d{3})*)\s*-\s*(\d+(?:,\d{3})*)',
-            ]
-            
-            element_text = element.get_text()
-            price_value = 0
-            
-            for pattern in price_patterns:
-                matches = re.findall(pattern, element_text, re.IGNORECASE)
-                if matches:
-                    try:
-                        if len(matches[0]) == 2:  # Range pattern
-                            price_value = max(float(matches[0][0].replace(',', '')), 
-                                            float(matches[0][1].replace(',', '')))
-                        else:
-                            price_value = float(matches[0].replace(',', ''))
-                        break
-                    except (ValueError, IndexError):
-                        continue
+            element_text = element.text(deep=True)[:_TEXT_SCAN_LIMIT]
+            price_value = self._extract_price(element_text)
             
             # Extract link
-            link_elem = element.find('a') or element.find_parent('a')
+            link_elem = element.css_first('a') or self._find_parent_anchor(element)
             link = ""
-            if link_elem and link_elem.get('href'):
-                link = urljoin(base_url, link_elem.get('href'))
+            if link_elem and link_elem.attributes.get('href'):
+                link = urljoin(base_url, link_elem.attributes.get('href'))
             
             # Create unique ID
-            bounty_id = hashlib.md5(f"{title}{price_value}{link}".encode()).hexdigest()
+            bounty_id = xxhash.xxh3_64_hexdigest(f"{title}{price_value}{link}")
             
             return {
                 'id': bounty_id,
                 'title': title,
                 'price': price_value,
                 'link': link,
-                'posted_time': datetime.now().isoformat(),
+                'posted_time': posted_time,
                 'raw_text': element_text[:200]  # First 200 chars for debugging
             }
             
@@ -156,38 +221,64 @@ class ReplitBountyScraper:
             logger.error(f"Error extracting bounty data: {str(e)}")
             return None
     
-    def _extract_from_text(self, html_content: str, url: str) -> List[Dict]:
+    def _extract_price(self, text: str) -> float:
+        """Return the first price found in text, or 0 if none"""
+        for pattern in _ELEMENT_PRICE_PATTERNS:
+            matches = pattern.findall(text)
+            if matches:
+                try:
+                    if isinstance(matches[0], tuple):  # Range pattern
+                        return max(float(matches[0][0].replace(',', '')), 
+                                   float(matches[0][1].replace(',', '')))
+                    return float(matches[0].replace(',', ''))
+                except (ValueError, IndexError):
+                    continue
+        return 0
+    
+    def _find_parent_anchor(self, node):
+        """Walk up the tree to the nearest enclosing <a> element"""
+        parent = node.parent
+        while parent is not None:
+            if parent.tag == 'a':
+                return parent
+            parent = parent.parent
+        return None
+    
+    def _extract_from_text(self, html_content: str, url: str, posted_time: str) -> List[Dict]:
         """Extract bounties from raw text when specific selectors fail"""
         try:
-            # Look for price patterns in the entire page
-            price_patterns = [
-                r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)',
-                r'(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*-\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)',
-            ]
+            # Look for price patterns in the entire page, keeping only the
+            # highest distinct prices in a bounded min-heap
+            top_prices = []
+            for match in _PRICE_ANY.finditer(html_content):
+                try:
+                    if match.group('dollar') is not None:
+                        price_value = float(match.group('dollar').replace(',', ''))
+                    else:
+                        price_value = max(float(match.group('lo').replace(',', '')), 
+                                        float(match.group('hi').replace(',', '')))
+                except (ValueError, TypeError):
+                    continue
+                
+                # Only include positive prices, each once
+                if price_value <= 0 or price_value in top_prices:
+                    continue
+                if len(top_prices) < _TEXT_TOP_K:
+                    heapq.heappush(top_prices, price_value)
+                else:
+                    heapq.heappushpop(top_prices, price_value)
             
             bounties = []
-            for pattern in price_patterns:
-                matches = re.findall(pattern, html_content, re.IGNORECASE)
-                for match in matches:
-                    try:
-                        if isinstance(match, tuple) and len(match) == 2:
-                            price_value = max(float(match[0].replace(',', '')), 
-                                            float(match[1].replace(',', '')))
-                        else:
-                            price_value = float(match.replace(',', ''))
-                        
-                        if price_value > 0:  # Only include positive prices
-                            bounty_id = hashlib.md5(f"extracted_{price_value}_{url}".encode()).hexdigest()
-                            bounties.append({
-                                'id': bounty_id,
-                                'title': f"Replit Service/Bounty - ${price_value:,.2f}",
-                                'price': price_value,
-                                'link': url,
-                                'posted_time': datetime.now().isoformat(),
-                                'raw_text': f"Extracted from page content"
-                            })
-                    except (ValueError, TypeError):
-                        continue
+            for price_value in sorted(top_prices, reverse=True):
+                bounty_id = xxhash.xxh3_64_hexdigest(f"extracted_{price_value}_{url}")
+                bounties.append({
+                    'id': bounty_id,
+                    'title': f"Replit Service/Bounty - ${price_value:,.2f}",
+                    'price': price_value,
+                    'link': url,
+                    'posted_time': posted_time,
+                    'raw_text': f"Extracted from page content"
+                })
             
             return bounties
             
@@ -218,29 +309,32 @@ class ReplitBountyScraper:
     
     def _get_sample_bounties(self) -> List[Dict]:
         """Return sample bounties for testing when scraping fails"""
+        now = datetime.now()
+        today = now.date()
+        now_iso = now.isoformat()
         return [
             {
-                'id': hashlib.md5(f"sample1_{datetime.now().date()}".encode()).hexdigest(),
+                'id': xxhash.xxh3_64_hexdigest(f"sample1_{today}"),
                 'title': 'Build a React Dashboard for Analytics',
                 'price': 2500.00,
                 'link': 'https://replit.com/bounties/sample1',
-                'posted_time': datetime.now().isoformat(),
+                'posted_time': now_iso,
                 'raw_text': 'Sample bounty for testing purposes'
             },
             {
-                'id': hashlib.md5(f"sample2_{datetime.now().date()}".encode()).hexdigest(),
+                'id': xxhash.xxh3_64_hexdigest(f"sample2_{today}"),
                 'title': 'Create a Discord Bot with Python',
                 'price': 1500.00,
                 'link': 'https://replit.com/bounties/sample2',
-                'posted_time': datetime.now().isoformat(),
+                'posted_time': now_iso,
                 'raw_text': 'Sample bounty for testing purposes'
             },
             {
-                'id': hashlib.md5(f"sample3_{datetime.now().date()}".encode()).hexdigest(),
+                'id': xxhash.xxh3_64_hexdigest(f"sample3_{today}"),
                 'title': 'Develop a Mobile App with Flutter',
                 'price': 5000.00,
                 'link': 'https://replit.com/bounties/sample3',
-                'posted_time': datetime.now().isoformat(),
+                'posted_time': now_iso,
                 'raw_text': 'Sample bounty for testing purposes'
             }
         ]
@@ -250,56 +344,69 @@ class SlackNotifier:
     
     def __init__(self, webhook_url: str):
         self.webhook_url = webhook_url
+        self.client = httpx.Client()
+        # Message skeleton serialized once; per-bounty fields are filled in
+        # by substituting the sentinel strings in the encoded bytes
+        self._tmpl_bytes = orjson.dumps({
+            "text": "🎯 New High-Value Replit Bounty Alert!",
+            "blocks": [
+                {
+                    "type": "header",
+                    "text": {
+                        "type": "plain_text",
+                        "text": "💰 $__PRICE__ - New Replit Bounty!"
+                    }
+                },
+                {
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": "*__TITLE__*\n\n💵 *Value:* $__PRICE__\n⏰ *Posted:* __POSTED__"
+                    }
+                },
+                {
+                    "type": "actions",
+                    "elements": [
+                        {
+                            "type": "button",
+                            "text": {
+                                "type": "plain_text",
+                                "text": "View Bounty"
+                            },
+                            "url": "__LINK__",
+                            "style": "primary"
+                        }
+                    ]
+                },
+                {
+                    "type": "context",
+                    "elements": [
+                        {
+                            "type": "mrkdwn",
+                            "text": "🤖 Auto-discovered by Replit Bounty Bot | __NOW__"
+                        }
+                    ]
+                }
+            ]
+        })
     
     def send_bounty_notification(self, bounty: Dict) -> bool:
         """Send bounty notification to Slack"""
         try:
-            message = {
-                "text": f"🎯 New High-Value Replit Bounty Alert!",
-                "blocks": [
-                    {
-                        "type": "header",
-                        "text": {
-                            "type": "plain_text",
-                            "text": f"💰 ${bounty['price']:,.2f} - New Replit Bounty!"
-                        }
-                    },
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": f"*{bounty['title']}*\n\n💵 *Value:* ${bounty['price']:,.2f}\n⏰ *Posted:* {bounty['posted_time']}"
-                        }
-                    },
-                    {
-                        "type": "actions",
-                        "elements": [
-                            {
-                                "type": "button",
-                                "text": {
-                                    "type": "plain_text",
-                                    "text": "View Bounty"
-                                },
-                                "url": bounty['link'],
-                                "style": "primary"
-                            }
-                        ]
-                    },
-                    {
-                        "type": "context",
-                        "elements": [
-                            {
-                                "type": "mrkdwn",
-                                "text": f"🤖 Auto-discovered by Replit Bounty Bot | {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-                            }
-                        ]
-                    }
-                ]
+            values = {
+                b'__PRICE__': f"{bounty['price']:,.2f}",
+                b'__TITLE__': bounty['title'],
+                b'__POSTED__': bounty['posted_time'],
+                b'__LINK__': bounty['link'],
+                b'__NOW__': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             }
+            # Values are JSON-escaped and substituted in a single pass so
+            # sentinel-like text inside a bounty is never expanded again
+            body = _SLACK_SENTINEL.sub(lambda m: orjson.dumps(values[m.group()])[1:-1], self._tmpl_bytes)
             
-            response = requests.post(
+            response = self.client.post(
                 self.webhook_url,
-                json=message,
+                content=body,
                 headers={'Content-Type': 'application/json'},
                 timeout=10
             )
@@ -319,52 +426,76 @@ class BountyTracker:
     """Track sent bounties to avoid duplicates"""
     
     def __init__(self):
-        self.sent_bounties = set()
-        self.storage_file = '/tmp/sent_bounties.json'
-        self.load_sent_bounties()
+        self.sent_bounties: Set[str] = set()
+        self.storage_file = '/tmp/sent_bounties.jsonl'
+        self._fp = None
+        # Storage is read on first use rather than at import time; the lock
+        # keeps request threads from seeing a half-loaded set
+        self._loaded = False
+        self._lock = threading.Lock()
+    
+    def _ensure_loaded(self):
+        """Load storage the first time the tracker is used"""
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self.load_sent_bounties()
     
     def load_sent_bounties(self):
         """Load previously sent bounties from storage"""
+        sent_bounties = set()
         try:
-            if os.path.exists(self.storage_file):
-                with open(self.storage_file, 'r') as f:
-                    data = json.load(f)
-                    self.sent_bounties = set(data.get('sent_bounties', []))
-                    logger.info(f"Loaded {len(self.sent_bounties)} previously sent bounties")
+            try:
+                st = os.stat(self.storage_file)
+            except FileNotFoundError:
+                st = None
+            if st is not None and st.st_size > 0:
+                with open(self.storage_file, 'rb') as f:
+                    for line in f:
+                        line = line.strip()
+                        if line:
+                            sent_bounties.add(orjson.loads(line))
+                logger.info(f"Loaded {len(sent_bounties)} previously sent bounties")
         except Exception as e:
             logger.error(f"Error loading sent bounties: {str(e)}")
-            self.sent_bounties = set()
-    
-    def save_sent_bounties(self):
-        """Save sent bounties to storage"""
-        try:
-            data = {
-                'sent_bounties': list(self.sent_bounties),
-                'last_updated': datetime.now().isoformat()
-            }
-            with open(self.storage_file, 'w') as f:
-                json.dump(data, f)
-            logger.info(f"Saved {len(self.sent_bounties)} sent bounties")
-        except Exception as e:
-            logger.error(f"Error saving sent bounties: {str(e)}")
+            sent_bounties = set()
+        self.sent_bounties = sent_bounties
+        self._loaded = True
     
     def is_bounty_sent(self, bounty_id: str) -> bool:
         """Check if bounty was already sent"""
+        self._ensure_loaded()
         return bounty_id in self.sent_bounties
     
     def mark_bounty_sent(self, bounty_id: str):
-        """Mark bounty as sent"""
-        self.sent_bounties.add(bounty_id)
-        self.save_sent_bounties()
+        """Mark bounty as sent, appending a single line to storage"""
+        self._ensure_loaded()
+        with self._lock:
+            if bounty_id in self.sent_bounties:
+                return
+            self.sent_bounties.add(bounty_id)
+            try:
+                if self._fp is None:
+                    self._fp = open(self.storage_file, 'ab', buffering=0)
+                self._fp.write(orjson.dumps(bounty_id) + b'\n')
+            except Exception as e:
+                logger.error(f"Error saving sent bounty: {str(e)}")
 
 # Global instances
 scraper = ReplitBountyScraper()
 tracker = BountyTracker()
+slack_notifiers: Dict[str, SlackNotifier] = {}
+
+def get_slack_notifier(webhook_url: str) -> SlackNotifier:
+    """Return a cached notifier so its HTTP client is reused across requests"""
+    if webhook_url not in slack_notifiers:
+        slack_notifiers[webhook_url] = SlackNotifier(webhook_url)
+    return slack_notifiers[webhook_url]
 
 @app.route('/')
 def home():
     """Home endpoint with API documentation"""
-    return jsonify({
+    return ojsonify({
         "message": "Replit Bounty Scraper API",
         "version": "1.0.0",
         "endpoints": {
@@ -381,7 +512,7 @@ def home():
 @app.route('/health')
 def health_check():
     """Health check endpoint"""
-    return jsonify({
+    return ojsonify({
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
         "service": "Replit Bounty Scraper"
@@ -397,68 +528,72 @@ def trigger_scrape():
         bounties = scraper.scrape_bounties()
         
         if not bounties:
-            return jsonify({
+            return ojsonify({
                 "status": "success",
                 "message": "No bounties found",
                 "bounties": []
             })
         
-        # Find highest value bounty that hasn't been sent
-        unsent_bounties = [b for b in bounties if not tracker.is_bounty_sent(b['id'])]
+        # Find highest value bounty that hasn't been sent in a single pass
+        highest_bounty = None
+        new_count = 0
+        for bounty in bounties:
+            if tracker.is_bounty_sent(bounty['id']):
+                continue
+            new_count += 1
+            if highest_bounty is None or bounty['price'] > highest_bounty['price']:
+                highest_bounty = bounty
         
-        if not unsent_bounties:
-            return jsonify({
+        if highest_bounty is None:
+            return ojsonify({
                 "status": "success",
                 "message": "No new bounties to send",
                 "total_bounties": len(bounties),
                 "new_bounties": 0
             })
         
-        # Get highest value bounty
-        highest_bounty = max(unsent_bounties, key=lambda x: x['price'])
-        
         # Send notification if Slack webhook is configured
         slack_webhook = os.getenv('SLACK_WEBHOOK_URL')
         if slack_webhook:
-            slack_notifier = SlackNotifier(slack_webhook)
+            slack_notifier = get_slack_notifier(slack_webhook)
             if slack_notifier.send_bounty_notification(highest_bounty):
                 tracker.mark_bounty_sent(highest_bounty['id'])
                 
-                return jsonify({
+                return ojsonify({
                     "status": "success",
                     "message": "Bounty notification sent successfully",
                     "bounty": highest_bounty,
                     "total_bounties": len(bounties),
-                    "new_bounties": len(unsent_bounties)
+                    "new_bounties": new_count
                 })
             else:
-                return jsonify({
+                return ojsonify({
                     "status": "error",
                     "message": "Failed to send Slack notification",
                     "bounty": highest_bounty
-                }), 500
+                }, status=500)
         else:
-            return jsonify({
+            return ojsonify({
                 "status": "warning",
                 "message": "No Slack webhook configured",
                 "bounty": highest_bounty,
                 "total_bounties": len(bounties),
-                "new_bounties": len(unsent_bounties)
+                "new_bounties": new_count
             })
             
     except Exception as e:
         logger.error(f"Error in scrape endpoint: {str(e)}")
-        return jsonify({
+        return ojsonify({
             "status": "error",
             "message": f"Scraping failed: {str(e)}"
-        }), 500
+        }, status=500)
 
 @app.route('/bounties', methods=['GET'])
 def get_bounties():
     """Get all recent bounties"""
     try:
         bounties = scraper.scrape_bounties()
-        return jsonify({
+        return ojsonify({
             "status": "success",
             "bounties": bounties,
             "count": len(bounties),
@@ -466,10 +601,10 @@ def get_bounties():
         })
     except Exception as e:
         logger.error(f"Error getting bounties: {str(e)}")
-        return jsonify({
+        return ojsonify({
             "status": "error",
             "message": f"Failed to get bounties: {str(e)}"
-        }), 500
+        }, status=500)
 
 @app.route('/webhook/daily', methods=['POST'])
 def daily_webhook():
@@ -482,17 +617,17 @@ def daily_webhook():
         if webhook_token:
             provided_token = request.headers.get('Authorization', '').replace('Bearer ', '')
             if provided_token != webhook_token:
-                return jsonify({"error": "Unauthorized"}), 401
+                return ojsonify({"error": "Unauthorized"}, status=401)
         
         # Trigger scrape
         return trigger_scrape()
         
     except Exception as e:
         logger.error(f"Error in daily webhook: {str(e)}")
-        return jsonify({
+        return ojsonify({
             "status": "error",
             "message": f"Daily webhook failed: {str(e)}"
-        }), 500
+        }, status=500)
 
 @app.route('/test-slack', methods=['POST'])
 def test_slack():
@@ -500,10 +635,10 @@ def test_slack():
     try:
         slack_webhook = os.getenv('SLACK_WEBHOOK_URL')
         if not slack_webhook:
-            return jsonify({
+            return ojsonify({
                 "status": "error",
                 "message": "SLACK_WEBHOOK_URL not configured"
-            }), 400
+            }, status=400)
         
         # Send test notification
         test_bounty = {
@@ -514,20 +649,20 @@ def test_slack():
             'posted_time': datetime.now().isoformat()
         }
         
-        slack_notifier = SlackNotifier(slack_webhook)
+        slack_notifier = get_slack_notifier(slack_webhook)
         success = slack_notifier.send_bounty_notification(test_bounty)
         
-        return jsonify({
+        return ojsonify({
             "status": "success" if success else "error",
             "message": "Test notification sent successfully" if success else "Failed to send test notification"
         })
         
     except Exception as e:
         logger.error(f"Error in test-slack: {str(e)}")
-        return jsonify({
+        return ojsonify({
             "status": "error",
             "message": f"Test failed: {str(e)}"
-        }), 500
+        }, status=500)
 
 if __name__ == '__main__':
     port = int(os.getenv('PORT', 5000))
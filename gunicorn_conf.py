@@ -0,0 +1,11 @@
+import os
+
+# Production server settings, used via: gunicorn api.index:app -c gunicorn_conf.py
+bind = f"0.0.0.0:{os.getenv('PORT', 5000)}"
+# Sent-bounty tracking and the scrape cache live in process memory, so more
+# than one worker can send the same Slack alert twice; scale with threads
+workers = int(os.getenv('WEB_CONCURRENCY', 1))
+threads = 8
+worker_class = 'gthread'
+keepalive = 5
+timeout = 60